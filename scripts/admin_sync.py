@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import argparse
+import hashlib
 import json
 import re
+import sqlite3
 from pathlib import Path
 
 JUZ_STARTS = [
@@ -436,12 +438,117 @@ def build_records(payload: dict) -> tuple[list[dict], dict]:
 
     return rows, report
 
+SQLITE_ROW_FIELDS = (
+    "surah_number", "surah_name", "juz_number", "ayah_number",
+    "arabic_text", "translation", "tafseer", "source_post_id",
+)
+
+# Mirrors public.ayahs from supabase/ayahs_admin.sql; row_hash drives incremental loads.
+SQLITE_SCHEMA = """
+create table if not exists ayahs (
+  id integer primary key,
+  surah_number integer not null check (surah_number > 0),
+  surah_name text not null,
+  juz_number integer,
+  ayah_number integer not null check (ayah_number > 0),
+  arabic_text text not null default '',
+  translation text not null default '',
+  tafseer text not null default '',
+  source_post_id integer,
+  row_hash text not null,
+  created_at text not null default (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
+  updated_at text not null default (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
+  unique (surah_number, ayah_number)
+);
+
+create index if not exists idx_ayahs_surah_ayah on ayahs (surah_number, ayah_number, juz_number, row_hash);
+create index if not exists idx_ayahs_juz on ayahs (juz_number, surah_number, ayah_number);
+
+create virtual table if not exists ayahs_fts using fts5(
+  translation,
+  tafseer,
+  content='ayahs',
+  content_rowid='id'
+);
+
+create trigger if not exists trg_ayahs_fts_insert after insert on ayahs begin
+  insert into ayahs_fts (rowid, translation, tafseer) values (new.id, new.translation, new.tafseer);
+end;
+
+create trigger if not exists trg_ayahs_fts_delete after delete on ayahs begin
+  insert into ayahs_fts (ayahs_fts, rowid, translation, tafseer) values ('delete', old.id, old.translation, old.tafseer);
+end;
+
+create trigger if not exists trg_ayahs_fts_update after update of translation, tafseer on ayahs begin
+  insert into ayahs_fts (ayahs_fts, rowid, translation, tafseer) values ('delete', old.id, old.translation, old.tafseer);
+  insert into ayahs_fts (rowid, translation, tafseer) values (new.id, new.translation, new.tafseer);
+end;
+"""
+
+
+def row_hash(row: dict) -> str:
+    payload = json.dumps([row.get(field) for field in SQLITE_ROW_FIELDS], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def export_sqlite(rows: list[dict], db_path: Path) -> dict:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(SQLITE_SCHEMA)
+
+        existing = {
+            (surah, ayah): digest
+            for surah, ayah, digest in conn.execute("select surah_number, ayah_number, row_hash from ayahs")
+        }
+
+        inserts = []
+        updates = []
+        seen = set()
+        for row in rows:
+            key = (row["surah_number"], row["ayah_number"])
+            seen.add(key)
+            digest = row_hash(row)
+            values = [row.get(field) for field in SQLITE_ROW_FIELDS]
+            if key not in existing:
+                inserts.append(values + [digest])
+            elif existing[key] != digest:
+                updates.append(values[1:3] + values[4:] + [digest, key[0], key[1]])
+        deletes = [key for key in existing if key not in seen]
+
+        # Single transaction: the FTS triggers only fire for rows that actually changed.
+        with conn:
+            conn.executemany(
+                "insert into ayahs (surah_number, surah_name, juz_number, ayah_number, arabic_text, "
+                "translation, tafseer, source_post_id, row_hash) values (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                inserts,
+            )
+            conn.executemany(
+                "update ayahs set surah_name = ?, juz_number = ?, arabic_text = ?, "
+                "translation = ?, tafseer = ?, source_post_id = ?, row_hash = ?, "
+                "updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now') "
+                "where surah_number = ? and ayah_number = ?",
+                updates,
+            )
+            conn.executemany("delete from ayahs where surah_number = ? and ayah_number = ?", deletes)
+    finally:
+        conn.close()
+
+    return {
+        "path": str(db_path),
+        "inserted": len(inserts),
+        "updated": len(updates),
+        "deleted": len(deletes),
+        "unchanged": len(rows) - len(inserts) - len(updates),
+    }
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Normalize Telegram Quran posts into ayah rows.")
     parser.add_argument("--input", default="result.json", help="Path to Telegram export JSON")
     parser.add_argument("--output", default="ayahs_formatted.json", help="Path to output ayah rows JSON")
     parser.add_argument("--report", default="scripts/sync_report.json", help="Path to validation report JSON")
+    parser.add_argument("--sqlite", help="Optional path to SQLite dataset (incremental by row hash)")
     args = parser.parse_args()
 
     input_path = Path(args.input)
@@ -452,11 +559,19 @@ def main() -> None:
     rows, report = build_records(payload)
 
     output_path.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.sqlite:
+        report["sqlite_export"] = export_sqlite(rows, Path(args.sqlite))
     report_path.parent.mkdir(parents=True, exist_ok=True)
     report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
 
     print(f"Wrote {len(rows)} rows to {output_path}")
     print(f"Validation report written to {report_path}")
+    if args.sqlite:
+        stats = report["sqlite_export"]
+        print(
+            f"SQLite dataset {stats['path']}: {stats['inserted']} inserted, {stats['updated']} updated, "
+            f"{stats['deleted']} deleted, {stats['unchanged']} unchanged"
+        )
 
 
 if __name__ == "__main__":